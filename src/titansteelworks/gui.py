@@ -1,7 +1,11 @@
 # src/titansteelworks/gui.py
+import json
 import os
+import queue
 import sys
 import threading
+import time
+from collections import deque
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, messagebox
@@ -112,21 +116,352 @@ CHUNKS = None
 VECS = None
 
 
+# Transcript tuning (kiosk sessions run for days; keep the widget small)
+HISTORY_PATH = Path(os.getenv("HISTORY_PATH") or (APP_ENV_DIR / "history.log"))
+# Paging correctness depends on these bounds, so clamp rather than trust the env.
+TRANSCRIPT_MAX_MESSAGES = max(1, int(os.getenv("TRANSCRIPT_MAX_MESSAGES", "200")))
+TRANSCRIPT_PAGE_SIZE    = max(1, int(os.getenv("TRANSCRIPT_PAGE_SIZE", "50")))
+TRANSCRIPT_FLUSH_MS     = max(0, int(os.getenv("TRANSCRIPT_FLUSH_MS", "50")))
+TRANSCRIPT_RETRY_MS     = max(1, int(os.getenv("TRANSCRIPT_RETRY_MS", "250")))
+
+
+# ----------------- History log -----------------
+class HistoryLog:
+    """
+    Append-only JSON-lines log of every transcript message, written off the UI thread.
+    Byte spans of this session's lines are kept so pages can be read back lazily.
+    """
+
+    UNREADABLE = ("System: [This message could not be read back from the history log.]", "sys")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.available = True
+        # (start, end) byte span per session message, or None if its write failed.
+        # Index i always matches session message i; spans are published only after a flush.
+        self.spans: list[tuple[int, int] | None] = []
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._writer, daemon=True)
+        self._thread.start()
+
+    def append(self, text: str, tag: str | None) -> None:
+        self._queue.put({"ts": time.strftime("%Y-%m-%d %H:%M:%S"), "tag": tag, "text": text})
+
+    def close(self, timeout: float = 2.0) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _writer(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(self.path, "ab")
+        except Exception:
+            # Logging is best-effort; never break the chat because the log is unavailable.
+            self.available = False
+            while self._queue.get() is not None:
+                pass
+            return
+        with f:
+            while True:
+                items = [self._queue.get()]
+                # Drain whatever else is queued so a burst costs one flush.
+                while True:
+                    try:
+                        items.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = None in items
+                spans: list[tuple[int, int] | None] = []
+                for item in items:
+                    if item is None:
+                        continue
+                    try:
+                        pos = f.tell()
+                        data = (json.dumps(item, ensure_ascii=False) + "\n").encode("utf-8")
+                        f.write(data)
+                        spans.append((pos, pos + len(data)))
+                    except Exception:
+                        spans.append(None)
+                try:
+                    f.flush()
+                except Exception:
+                    spans = [None] * len(spans)
+                self.spans.extend(spans)
+                if stop:
+                    return
+
+    def read(self, start: int, end: int) -> list[tuple[str, str | None]]:
+        """
+        Return messages [start, end) of this session, or [] if they are not written yet.
+        Entries that fail to write or parse come back as UNREADABLE placeholders.
+        """
+        if start < 0 or end <= start or end > len(self.spans):
+            return []
+        out: list[tuple[str, str | None]] = []
+        try:
+            f = open(self.path, "rb")
+        except Exception:
+            return [self.UNREADABLE] * (end - start)
+        with f:
+            for span in self.spans[start:end]:
+                try:
+                    if span is None:
+                        raise ValueError("message was not written")
+                    f.seek(span[0])
+                    item = json.loads(f.read(span[1] - span[0]).decode("utf-8"))
+                    out.append((item.get("text", ""), item.get("tag")))
+                except Exception:
+                    out.append(self.UNREADABLE)
+        return out
+
+
 # ----------------- UI helpers -----------------
-def append_text(widget: tk.Text, text: str, tag: str | None = None) -> None:
-    widget.configure(state="normal")
-    widget.insert("end", (text + "\n"), (tag,) if tag else ())
-    widget.see("end")
-    widget.configure(state="disabled")
+def older_page(first: int, page_size: int) -> tuple[int, int]:
+    """Session range [start, first) to page in above the window."""
+    return max(0, first - page_size), first
+
+
+def newer_page(last: int, total: int, page_size: int) -> tuple[int, int]:
+    """Session range [last, end) to page in below the window."""
+    return last, min(total, last + page_size)
 
 
-def on_send(entry: ttk.Entry, output: tk.Text, send_btn: ttk.Button, status: ttk.Label) -> None:
+def eviction_plan(
+    lines: list[int] | deque[int],
+    top: int,
+    bottom: int,
+    cap: int,
+    following: bool,
+    can_page: bool,
+) -> tuple[int, int]:
+    """
+    Decide how many messages to drop from the (top, bottom) of the window.
+
+    `lines` holds the line count of each shown message; `top`/`bottom` are the first and last
+    visible Text lines (1-based). While following the tail, or with no log to page back from,
+    the oldest messages go. Otherwise only off-screen messages are dropped, far side first.
+    """
+    excess = len(lines) - cap
+    if excess <= 0:
+        return 0, 0
+    if following or not can_page:
+        return excess, 0
+    above = below = 0
+    line = 1
+    for n in lines:
+        if line + n <= top:
+            above += 1
+        elif line > bottom:
+            below += 1
+        line += n
+    if below > above:
+        drop_bottom = min(excess, below)
+        return min(excess - drop_bottom, above), drop_bottom
+    drop_top = min(excess, above)
+    return drop_top, min(excess - drop_top, below)
+
+
+class Transcript:
+    """
+    Bounded view over the chat history.
+
+    The Text widget holds a window [_first, _last) of at most TRANSCRIPT_MAX_MESSAGES session
+    messages. Appends are coalesced into a single after() tick; when the cap is exceeded,
+    messages are evicted from whichever side is furthest from the view and paged back in from
+    the history log when the user scrolls to that edge.
+    """
+
+    def __init__(self, widget: tk.Text, scrollbar: ttk.Scrollbar, history: HistoryLog | None):
+        self.widget = widget
+        self.scrollbar = scrollbar
+        self.history = history
+        self._lines: deque[int] = deque()  # line count of each message shown, top to bottom
+        self._first = 0  # session index of the top message in the widget
+        self._last = 0  # session index just past the bottom message in the widget
+        self._total = 0  # messages flushed this session
+        self._pending: list[tuple[str, str | None]] = []
+        self._flush_id: str | None = None
+        self._retry_id: str | None = None
+        self._loading = False
+        self._follow = False
+        widget.configure(yscrollcommand=self._on_yscroll)
+
+    def append(self, text: str, tag: str | None = None, follow: bool = False) -> None:
+        """
+        Queue a message for the next flush. `follow=True` (the user's own exchange) jumps the
+        view back to the live tail; otherwise a reader scrolled back is left where they are.
+        """
+        if self.history is not None:
+            self.history.append(text, tag)
+        self._pending.append((text, tag))
+        self._follow = self._follow or follow
+        if self._flush_id is None:
+            self._flush_id = self.widget.after(TRANSCRIPT_FLUSH_MS, self._flush)
+
+    def close(self) -> None:
+        # Pending messages are already queued for the log; just make sure no callback
+        # fires against a destroyed window.
+        for after_id in (self._flush_id, self._retry_id):
+            if after_id is not None:
+                try:
+                    self.widget.after_cancel(after_id)
+                except Exception:
+                    pass
+        self._flush_id = self._retry_id = None
+        if self.history is not None:
+            self.history.close()
+
+    def _has_history(self) -> bool:
+        return self.history is not None and self.history.available
+
+    def _flush(self) -> None:
+        self._flush_id = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        follow, self._follow = self._follow, False
+        w = self.widget
+        if follow and self._last != self._total:
+            self._jump_to_tail()
+        tail_shown = self._last == self._total
+        following = follow or (tail_shown and w.yview()[1] >= 0.999)
+        self._total += len(pending)
+        if tail_shown:
+            w.configure(state="normal")
+            for text, tag in pending:
+                w.insert("end", (text + "\n"), (tag,) if tag else ())
+                self._lines.append(text.count("\n") + 1)
+            w.configure(state="disabled")
+            self._last = self._total
+        # Otherwise the newest messages live only in the log until the reader scrolls down.
+        self._enforce_cap(following)
+        if following:
+            w.see("end")
+
+    def _jump_to_tail(self) -> None:
+        # Restart the window empty at the live tail; older messages page back in from the log
+        # (immediately, while the window is too short to scroll).
+        w = self.widget
+        w.configure(state="normal")
+        w.delete("1.0", "end")
+        w.configure(state="disabled")
+        self._lines.clear()
+        self._first = self._last = self._total
+
+    def _visible_lines(self) -> tuple[int, int]:
+        w = self.widget
+        top = int(w.index("@0,0").split(".")[0])
+        bottom = int(w.index(f"@0,{max(w.winfo_height(), 1)}").split(".")[0])
+        return top, bottom
+
+    def _enforce_cap(self, following: bool) -> None:
+        if len(self._lines) <= TRANSCRIPT_MAX_MESSAGES:
+            return
+        top, bottom = self._visible_lines()
+        drop_top, drop_bottom = eviction_plan(
+            self._lines, top, bottom, TRANSCRIPT_MAX_MESSAGES, following, self._has_history()
+        )
+        self._drop_bottom(drop_bottom)
+        self._drop_top(drop_top)
+
+    def _drop_top(self, count: int) -> int:
+        if count <= 0:
+            return 0
+        w = self.widget
+        top = int(w.index("@0,0").split(".")[0])
+        drop = sum(self._lines.popleft() for _ in range(count))
+        w.configure(state="normal")
+        w.delete("1.0", f"{drop + 1}.0")
+        w.configure(state="disabled")
+        self._first += count
+        # Keep the reader's line in place.
+        w.yview(f"{max(top - drop, 1)}.0")
+        return count
+
+    def _drop_bottom(self, count: int) -> int:
+        if count <= 0:
+            return 0
+        w = self.widget
+        drop = sum(self._lines.pop() for _ in range(count))
+        w.configure(state="normal")
+        w.delete(f"end-1c linestart -{drop} lines", "end-1c")
+        w.configure(state="disabled")
+        self._last -= count
+        return count
+
+    def _on_yscroll(self, first: str, last: str) -> None:
+        self.scrollbar.set(first, last)
+        if not self._loading and self._retry_id is None:
+            self._loading = True
+            self.widget.after_idle(self._check_edges)
+
+    def _check_edges(self) -> None:
+        self._loading = False
+        if not self._has_history():
+            return
+        first, last = self.widget.yview()
+        if first <= 0.0 and self._first > 0:
+            self._load_older()
+        elif last >= 1.0 and self._last < self._total:
+            self._load_newer()
+
+    def _retry_later(self) -> None:
+        # The page isn't in the log yet (writer still flushing); look again shortly, since Tk
+        # sends no further yscroll events while the view sits at the edge.
+        def retry():
+            self._retry_id = None
+            self._check_edges()
+
+        if self._retry_id is None:
+            self._retry_id = self.widget.after(TRANSCRIPT_RETRY_MS, retry)
+
+    def _load_older(self) -> None:
+        start, _ = older_page(self._first, TRANSCRIPT_PAGE_SIZE)
+        older = self.history.read(start, self._first) if self.history is not None else []
+        if not older:
+            self._retry_later()
+            return
+        w = self.widget
+        w.configure(state="normal")
+        inserted = 0
+        for text, tag in reversed(older):
+            w.insert("1.0", (text + "\n"), (tag,) if tag else ())
+            n = text.count("\n") + 1
+            self._lines.appendleft(n)
+            inserted += n
+        w.configure(state="disabled")
+        self._first = start
+        # Keep the previously visible top line in place.
+        w.yview(f"{inserted + 1}.0")
+        self._enforce_cap(following=False)
+
+    def _load_newer(self) -> None:
+        _, end = newer_page(self._last, self._total, TRANSCRIPT_PAGE_SIZE)
+        newer = self.history.read(self._last, end) if self.history is not None else []
+        if not newer:
+            self._retry_later()
+            return
+        w = self.widget
+        w.configure(state="normal")
+        for text, tag in newer:
+            w.insert("end", (text + "\n"), (tag,) if tag else ())
+            self._lines.append(text.count("\n") + 1)
+        w.configure(state="disabled")
+        self._last = end
+        self._enforce_cap(following=False)
+
+
+def append_text(transcript: Transcript, text: str, tag: str | None = None, follow: bool = False) -> None:
+    transcript.append(text, tag, follow=follow)
+
+
+def on_send(entry: ttk.Entry, transcript: Transcript, send_btn: ttk.Button, status: ttk.Label) -> None:
     msg = entry.get().strip()
     if not msg:
         return
 
     entry.delete(0, "end")
-    append_text(output, f"You: {msg}", "user")
+    append_text(transcript, f"You: {msg}", "user", follow=True)
     send_btn.config(state="disabled")
     status.config(text="Thinking…")
 
@@ -191,18 +526,18 @@ def on_send(entry: ttk.Entry, output: tk.Text, send_btn: ttk.Button, status: ttk
                         done.set()
 
                 # Schedule the UI flow on the main thread and wait for completion (worker thread waits).
-                output.after(0, ui_retry_flow)
+                transcript.widget.after(0, ui_retry_flow)
                 done.wait(120)
                 reply = result.get("reply") or f"[Error] {e}"
             else:
                 reply = f"[Error] {e}"
 
         def done():
-            append_text(output, f"Chatbot: {reply}", "bot")
+            append_text(transcript, f"Chatbot: {reply}", "bot", follow=True)
             send_btn.config(state="normal")
             status.config(text="Ready")
 
-        output.after(0, done)
+        transcript.widget.after(0, done)
 
     threading.Thread(target=worker, daemon=True).start()
 
@@ -239,7 +574,6 @@ def build_ui(show_demo_banner: bool):
         pady=6,
     )
     vscroll = ttk.Scrollbar(mid, command=output.yview)
-    output.configure(yscrollcommand=vscroll.set)
 
     output.grid(row=0, column=0, sticky="nsew")
     vscroll.grid(row=0, column=1, sticky="ns")
@@ -251,6 +585,8 @@ def build_ui(show_demo_banner: bool):
     output.tag_configure("bot", foreground="#0a0a0a")
     output.tag_configure("sys", foreground="#6e7781", font=("Segoe UI", 9, "italic"))
 
+    transcript = Transcript(output, vscroll, HistoryLog(HISTORY_PATH))
+
     # --- Input row ---
     bottom = ttk.Frame(win, padding=(10, 0, 10, 10))
     bottom.pack(fill="x")
@@ -261,7 +597,7 @@ def build_ui(show_demo_banner: bool):
     send_btn = ttk.Button(
         bottom,
         text="Send",
-        command=lambda: on_send(entry, output, send_btn, status),
+        command=lambda: on_send(entry, transcript, send_btn, status),
         state="disabled",
     )
     send_btn.pack(side="right")
@@ -284,9 +620,16 @@ def build_ui(show_demo_banner: bool):
         except Exception as e:
             messagebox.showerror("Error", f"Could not save API key:\n{e}")
 
+    # Let the history writer drain before the window goes away.
+    def _close():
+        transcript.close()
+        win.destroy()
+
+    win.protocol("WM_DELETE_WINDOW", _close)
+
     menubar = tk.Menu(win)
     file_menu = tk.Menu(menubar, tearoff=0)
-    file_menu.add_command(label="Exit", command=win.destroy)
+    file_menu.add_command(label="Exit", command=_close)
     menubar.add_cascade(label="File", menu=file_menu)
 
     help_menu = tk.Menu(menubar, tearoff=0)
@@ -304,14 +647,14 @@ def build_ui(show_demo_banner: bool):
 
     # Enter to send
     def _enter(evt):
-        on_send(entry, output, send_btn, status)
+        on_send(entry, transcript, send_btn, status)
         return "break"
 
     entry.bind("<Return>", _enter)
 
     # Friendly greeting
     append_text(
-        output,
+        transcript,
         "Chatbot: Good day, and welcome to Titan Steelworks’ AI Assistant—how may I help you today?",
         "bot",
     )
@@ -319,7 +662,7 @@ def build_ui(show_demo_banner: bool):
     # Demo Mode banner
     if show_demo_banner:
         append_text(
-            output,
+            transcript,
             "System: Running in DEMO MODE (canned answers). Use Help → “Enter/OpenAI API Key…” to switch to Live AI.",
             "sys",
         )
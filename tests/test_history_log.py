@@ -0,0 +1,116 @@
+import time
+
+import pytest
+
+from titansteelworks.gui import HistoryLog, eviction_plan, newer_page, older_page
+
+
+def _wait_written(log: HistoryLog, n: int, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while len(log.spans) < n:
+        if time.monotonic() > deadline:
+            raise AssertionError(f"only {len(log.spans)} of {n} messages written")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def log(tmp_path):
+    h = HistoryLog(tmp_path / "sub" / "history.log")
+    yield h
+    h.close()
+
+
+def test_round_trip_and_slices(log):
+    for i in range(6):
+        log.append(f"m{i}", "bot" if i % 2 else "user")
+    _wait_written(log, 6)
+
+    assert log.read(0, 6) == [(f"m{i}", "bot" if i % 2 else "user") for i in range(6)]
+    assert log.read(2, 4) == [("m2", "user"), ("m3", "bot")]
+    assert log.read(5, 6) == [("m5", "bot")]
+
+
+@pytest.mark.parametrize("start,end", [(3, 7), (6, 7), (-1, 2), (2, 2), (4, 1)])
+def test_out_of_range_reads_are_empty(log, start, end):
+    for i in range(6):
+        log.append(f"m{i}", "bot")
+    _wait_written(log, 6)
+
+    assert log.read(start, end) == []
+
+
+def test_unicode_line_separators_survive(log):
+    texts = ["a", "line\u2028sep", "para\u2029sep\x85nel", "multi\nline", "d"]
+    for t in texts:
+        log.append(t, "bot")
+    _wait_written(log, len(texts))
+
+    assert [text for text, _ in log.read(0, len(texts))] == texts
+
+
+def test_failed_write_keeps_indices_and_yields_placeholder(log):
+    for i in range(3):
+        log.append(f"m{i}", "bot")
+    _wait_written(log, 3)
+    log.spans[1] = None  # as recorded by the writer when a write fails
+
+    assert log.read(0, 3) == [("m0", "bot"), HistoryLog.UNREADABLE, ("m2", "bot")]
+
+
+def test_log_is_append_only_across_sessions(tmp_path):
+    path = tmp_path / "history.log"
+    first = HistoryLog(path)
+    first.append("old", "bot")
+    first.close()
+
+    second = HistoryLog(path)
+    second.append("new", "user")
+    _wait_written(second, 1)
+    try:
+        assert second.read(0, 1) == [("new", "user")]
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+    finally:
+        second.close()
+
+
+def test_page_ranges():
+    assert older_page(120, 50) == (70, 120)
+    assert older_page(30, 50) == (0, 30)
+    assert newer_page(100, 130, 50) == (100, 130)
+    assert newer_page(100, 300, 50) == (100, 150)
+
+
+def test_eviction_under_cap_is_noop():
+    assert eviction_plan([1, 1, 1], top=1, bottom=3, cap=3, following=False, can_page=True) == (0, 0)
+
+
+def test_eviction_following_drops_oldest():
+    assert eviction_plan([1] * 8, top=4, bottom=8, cap=5, following=True, can_page=True) == (3, 0)
+
+
+def test_eviction_without_log_drops_oldest_even_when_scrolled_back():
+    assert eviction_plan([1] * 8, top=1, bottom=2, cap=5, following=False, can_page=False) == (3, 0)
+
+
+def test_eviction_scrolled_to_top_drops_offscreen_tail():
+    # Lines 1-2 visible; messages 3..8 are below the view.
+    assert eviction_plan([1] * 8, top=1, bottom=2, cap=5, following=False, can_page=True) == (0, 3)
+
+
+def test_eviction_prefers_far_side_then_spills_over():
+    # Two messages above the view, one below: the top is further, so it goes first.
+    lines = [1, 1, 1, 1, 1, 1]
+    assert eviction_plan(lines, top=3, bottom=5, cap=3, following=False, can_page=True) == (2, 1)
+
+
+def test_eviction_counts_multiline_messages():
+    # Message line spans: 1-3, 4, 5-6, 7, 8. View shows lines 4-5, so only
+    # message 0 is fully above and messages 3-4 are below.
+    lines = [3, 1, 2, 1, 1]
+    assert eviction_plan(lines, top=4, bottom=5, cap=2, following=False, can_page=True) == (1, 2)
+
+
+def test_eviction_never_drops_visible_messages():
+    lines = [1] * 10
+    drop_top, drop_bottom = eviction_plan(lines, top=2, bottom=9, cap=3, following=False, can_page=True)
+    assert (drop_top, drop_bottom) == (1, 1)